@@ -12,7 +12,7 @@ from .kinds import StateVector, Step, Execution, Verdict
 from .ops import admissible_step, apply_step, validate_execution, closed
 from .canonical import canonical_json_bytes, execution_to_obj
 from .hashing import sha256_hex, sha256_bytes, xk_id
-from .receipt import receipt_object, receipt_json_bytes, verify_receipt
+from .receipt import receipt_object, receipt_json_bytes, verify_receipt, verify_receipts
 from .receipt_hashing import receipt_sha256_bytes, receipt_sha256_hex, receipt_id
 
 __all__ = [
@@ -36,6 +36,7 @@ __all__ = [
     "receipt_object",
     "receipt_json_bytes",
     "verify_receipt",
+    "verify_receipts",
     # receipt hashing
     "receipt_sha256_bytes",
     "receipt_sha256_hex",
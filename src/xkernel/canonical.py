@@ -5,6 +5,11 @@ from typing import Any, Dict, List
 
 from .kinds import Execution, StateVector, Step
 
+try:
+    import orjson as _orjson
+except ImportError:  # optional: pip install xkernel[fast]
+    _orjson = None
+
 
 def _assert_int_list(xs: List[int], path: str) -> None:
     if not isinstance(xs, list) or len(xs) == 0:
@@ -59,7 +64,33 @@ def execution_to_obj(E: Execution) -> Dict[str, Any]:
     }
 
 
-def canonical_json_bytes(E: Execution) -> bytes:
-    obj = execution_to_obj(E)
+def _stdlib_json_bytes(obj: Any) -> bytes:
     s = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
     return s.encode("utf-8")
+
+
+def _fast_json_bytes(obj: Any) -> bytes:
+    # Only for objects already checked by _assert_jsonable: orjson and the
+    # stdlib agree byte-for-byte on str/int/bool/None/list/dict, but not on
+    # floats. Anything orjson refuses (ints wider than 64 bits, lone
+    # surrogates) goes through the stdlib so errors and output stay the same.
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass
+    return _stdlib_json_bytes(obj)
+
+
+def canonical_json_bytes(E: Execution) -> bytes:
+    """
+    Canonical JSON bytes for an execution:
+      - UTF-8
+      - sorted keys
+      - no whitespace
+
+    Encoded with orjson when installed, else the stdlib; both give the same
+    bytes because validation admits only str/int/bool/None/list/dict.
+    The encoders differ on floats, so validation must stay ahead of encoding.
+    """
+    return _fast_json_bytes(execution_to_obj(E))
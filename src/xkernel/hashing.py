@@ -5,6 +5,9 @@ import hashlib
 from .kinds import Execution
 from .canonical import canonical_json_bytes
 
+XK_ID_PREFIX = "xk:sha256:"
+XK_ID_LENGTH = len(XK_ID_PREFIX) + 64  # prefix + hex sha256
+
 
 def sha256_bytes(E: Execution) -> bytes:
     return hashlib.sha256(canonical_json_bytes(E)).digest()
@@ -15,4 +18,4 @@ def sha256_hex(E: Execution) -> str:
 
 
 def xk_id(E: Execution) -> str:
-    return f"xk:sha256:{sha256_hex(E)}"
+    return f"{XK_ID_PREFIX}{sha256_hex(E)}"
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateVector:
     coords: List[int]
     meta: Dict[str, Any] = field(default_factory=dict)
@@ -17,7 +17,7 @@ class StateVector:
                 raise TypeError(f"StateVector.coords[{i}] must be int (got {type(v).__name__})")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Step:
     id: str
     delta: StateVector
@@ -31,7 +31,7 @@ class Step:
             raise TypeError("Step.action must be int")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Execution:
     init: StateVector
     steps: List[Step]
@@ -43,7 +43,7 @@ class Execution:
             raise TypeError("Execution.steps must be a list[Step]")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Verdict:
     ok: bool
     reason: str
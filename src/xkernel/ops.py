@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import add
 from typing import List
 
 from .kinds import Execution, StateVector, Step, Verdict
@@ -14,7 +15,7 @@ def admissible_step(s: Step) -> bool:
 def _add_coords(a: List[int], b: List[int]) -> List[int]:
     if len(a) != len(b):
         raise ValueError(f"Dimension mismatch: {len(a)} != {len(b)}")
-    return [a[i] + b[i] for i in range(len(a))]
+    return list(map(add, a, b))
 
 
 def apply_step(st: StateVector, s: Step) -> StateVector:
@@ -23,6 +24,12 @@ def apply_step(st: StateVector, s: Step) -> StateVector:
 
 
 def validate_execution(E: Execution) -> Verdict:
+    # Admissibility and replay share one pass over the steps. Replay runs on
+    # bare coords: meta is never inspected, so skip the per-step
+    # StateVector/meta copies that apply_step makes. A replay error does not
+    # end the pass, because a non-admissible step anywhere takes precedence.
+    coords = E.init.coords
+    replay_error: str | None = None
     for idx, s in enumerate(E.steps):
         if not admissible_step(s):
             return Verdict(
@@ -30,22 +37,27 @@ def validate_execution(E: Execution) -> Verdict:
                 reason="NON_ADMISSIBLE_STEP",
                 details={"index": idx, "step_id": s.id, "action": s.action, "expected": K_STEP_QUANTUM},
             )
+        if replay_error is None:
+            try:
+                coords = _add_coords(coords, s.delta.coords)
+            except Exception as ex:
+                replay_error = str(ex)
 
-    st = E.init
-    try:
-        for s in E.steps:
-            st = apply_step(st, s)
-    except Exception as ex:
-        return Verdict(ok=False, reason="REPLAY_ERROR", details={"error": str(ex)})
+    if replay_error is not None:
+        return Verdict(ok=False, reason="REPLAY_ERROR", details={"error": replay_error})
 
-    if st.coords != E.final.coords:
-        return Verdict(ok=False, reason="REPLAY_MISMATCH", details={"computed": st.coords, "declared": E.final.coords})
+    if coords != E.final.coords:
+        return Verdict(ok=False, reason="REPLAY_MISMATCH", details={"computed": coords, "declared": E.final.coords})
 
     return Verdict(ok=True, reason="OK", details={})
 
 
 def closed(E: Execution, target: StateVector) -> bool:
-    v = validate_execution(E)
+    return _closed_given(validate_execution(E), E, target)
+
+
+def _closed_given(v: Verdict, E: Execution, target: StateVector) -> bool:
+    # closed() for callers that already hold validate_execution(E).
     if not v.ok:
         return False
     return E.final.coords == target.coords
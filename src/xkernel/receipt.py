@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from .kinds import Execution, StateVector, Verdict
-from .ops import validate_execution, closed
-from .hashing import xk_id
+from .ops import validate_execution, _closed_given
+from .hashing import XK_ID_LENGTH, XK_ID_PREFIX, xk_id
 
 
 RECEIPT_SPEC = "XKERNEL_RECEIPT_V1"
 RECEIPT_VERSION = "1.0.0-draft"
 
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
 
 def receipt_object(
     *,
@@ -47,7 +49,7 @@ def receipt_object(
                 "coords": list(target.coords),
                 "meta": dict(target.meta),
             },
-            "closed": closed(execution, target),
+            "closed": _closed_given(verdict, execution, target),
         }
 
     return receipt
@@ -80,6 +82,50 @@ def verify_receipt(
 
     Returns a Verdict (OK / reason / details).
     """
+    return _verify_receipt(receipt, execution, {})
+
+
+def verify_receipts(
+    *,
+    pairs: Iterable[Tuple[Dict[str, Any], Execution]],
+) -> List[Verdict]:
+    """
+    Verify many (receipt, execution) pairs, in order.
+
+    Same checks as verify_receipt, but each distinct Execution object is
+    hashed and validated at most once per call, however many receipts
+    refer to it.
+
+    pairs is read in full before any check runs, so every pair is verified
+    against the same state of each Execution even if an iterator mutates
+    one between yields.
+    """
+    pairs = list(pairs)
+    memo: Dict[Tuple[str, int], Tuple[Execution, Any]] = {}
+    return [_verify_receipt(receipt, execution, memo) for receipt, execution in pairs]
+
+
+def _memo(
+    memo: Dict[Tuple[str, int], Tuple[Execution, Any]],
+    kind: str,
+    execution: Execution,
+    fn: Callable[[Execution], Any],
+) -> Any:
+    # Keyed by identity; the entry keeps the Execution alive so its id()
+    # cannot be reused by another object while the memo exists.
+    key = (kind, id(execution))
+    hit = memo.get(key)
+    if hit is None:
+        hit = (execution, fn(execution))
+        memo[key] = hit
+    return hit[1]
+
+
+def _verify_receipt(
+    receipt: Dict[str, Any],
+    execution: Execution,
+    memo: Dict[Tuple[str, int], Tuple[Execution, Any]],
+) -> Verdict:
     if not isinstance(receipt, dict):
         return Verdict(ok=False, reason="RECEIPT_BAD_TYPE", details={"expected": "dict"})
 
@@ -90,8 +136,21 @@ def verify_receipt(
     if ver != RECEIPT_VERSION:
         return Verdict(ok=False, reason="RECEIPT_BAD_VERSION", details={"version": ver, "expected": RECEIPT_VERSION})
 
-    expected_exec_id = xk_id(execution)
+    # A malformed id can never match, so reject it before hashing the execution.
     got_exec_id = receipt.get("execution_id")
+    if (
+        not isinstance(got_exec_id, str)
+        or len(got_exec_id) != XK_ID_LENGTH
+        or not got_exec_id.startswith(XK_ID_PREFIX)
+        or not _HEX_DIGITS.issuperset(got_exec_id[len(XK_ID_PREFIX):])
+    ):
+        return Verdict(
+            ok=False,
+            reason="RECEIPT_EXECUTION_ID_MISMATCH",
+            details={"got": got_exec_id, "expected_format": f"{XK_ID_PREFIX}<64 hex>"},
+        )
+
+    expected_exec_id = _memo(memo, "xk_id", execution, xk_id)
     if got_exec_id != expected_exec_id:
         return Verdict(
             ok=False,
@@ -100,7 +159,7 @@ def verify_receipt(
         )
 
     # Verdict consistency
-    expected_v = validate_execution(execution)
+    expected_v = _memo(memo, "verdict", execution, validate_execution)
     got_v = receipt.get("verdict", {})
     if not isinstance(got_v, dict):
         return Verdict(ok=False, reason="RECEIPT_BAD_VERDICT", details={"expected": "dict"})
@@ -135,7 +194,7 @@ def verify_receipt(
 
         target_sv = StateVector(coords=list(coords), meta=dict(meta))
 
-        expected_closed = closed(execution, target_sv)
+        expected_closed = _closed_given(expected_v, execution, target_sv)
         got_closed = cl.get("closed")
         if got_closed != expected_closed:
             return Verdict(
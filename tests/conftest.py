@@ -0,0 +1,18 @@
+import pytest
+
+from xkernel import StateVector, Step, Execution
+
+
+@pytest.fixture(scope="session")
+def sample_execution() -> Execution:
+    # Shared across the receipt tests. Tests mutate the receipts they build,
+    # never this execution.
+    return Execution(
+        init=StateVector([0, 0]),
+        steps=[
+            Step(id="s1", delta=StateVector([1, 0]), action=1),
+            Step(id="s2", delta=StateVector([0, 1]), action=1),
+        ],
+        final=StateVector([1, 1]),
+        claims={"intent": "receipt-test"},
+    )
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+import xkernel.canonical as canonical
+from xkernel import (
+    StateVector,
+    Step,
+    Execution,
+    canonical_json_bytes,
+    execution_to_obj,
+)
+
+
+def _sample_execution() -> Execution:
+    return Execution(
+        init=StateVector([0, 0], meta={"label": "origin"}),
+        steps=[
+            Step(id="s1", delta=StateVector([1, 0]), action=1, witness={"why": ["x"]}),
+            Step(id="s2", delta=StateVector([0, 1]), action=1),
+        ],
+        final=StateVector([1, 1]),
+        claims={"intent": "canonical-test"},
+    )
+
+
+def test_canonical_bytes_reject_non_jsonable_claims():
+    E = _sample_execution()
+    E.claims["bad"] = 1.5  # floats are not canonical
+
+    with pytest.raises(TypeError):
+        canonical_json_bytes(E)
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def encoder(request, monkeypatch):
+    # Run the equivalence checks once per encoder path canonical_json_bytes can take.
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(canonical, "_orjson", None)
+    return request.param
+
+
+def _stdlib_bytes(E: Execution) -> bytes:
+    s = json.dumps(execution_to_obj(E), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return s.encode("utf-8")
+
+
+def test_canonical_bytes_match_stdlib_encoding(encoder):
+    E = Execution(
+        init=StateVector([2**63 - 1, -(2**63)], meta={"é": "\u2028\x00\x1f\"\\", "a": True, "Z": None}),
+        steps=[
+            Step(id="\U0001f600", delta=StateVector([-1, 0]), action=1, witness={"\uffff": [[], {}]}),
+        ],
+        final=StateVector([2**63 - 2, -(2**63)]),
+        claims={"b": [1, "x"], "a": {"\x7f": False}},
+    )
+    assert canonical_json_bytes(E) == _stdlib_bytes(E)
+
+
+def test_canonical_bytes_match_stdlib_encoding_for_wide_ints(encoder):
+    E = Execution(
+        init=StateVector([0]),
+        steps=[Step(id="s1", delta=StateVector([2**70]), action=1)],
+        final=StateVector([2**70]),
+    )
+    assert canonical_json_bytes(E) == _stdlib_bytes(E)
@@ -1,27 +1,13 @@
 from xkernel import (
     StateVector,
-    Step,
-    Execution,
     receipt_object,
     receipt_sha256_hex,
     receipt_id,
 )
 
 
-def _sample_execution() -> Execution:
-    return Execution(
-        init=StateVector([0, 0]),
-        steps=[
-            Step(id="s1", delta=StateVector([1, 0]), action=1),
-            Step(id="s2", delta=StateVector([0, 1]), action=1),
-        ],
-        final=StateVector([1, 1]),
-        claims={"intent": "receipt-hash-test"},
-    )
-
-
-def test_receipt_hash_is_deterministic():
-    E = _sample_execution()
+def test_receipt_hash_is_deterministic(sample_execution):
+    E = sample_execution
     r1 = receipt_object(execution=E, target=StateVector([1, 1]))
     r2 = receipt_object(execution=E, target=StateVector([1, 1]))
 
@@ -33,8 +19,8 @@ def test_receipt_hash_is_deterministic():
     assert receipt_id(r1).endswith(h1)
 
 
-def test_receipt_hash_changes_on_tamper():
-    E = _sample_execution()
+def test_receipt_hash_changes_on_tamper(sample_execution):
+    E = sample_execution
     r = receipt_object(execution=E, target=StateVector([1, 1]))
     h1 = receipt_sha256_hex(r)
 
@@ -4,33 +4,81 @@ from xkernel import (
     Execution,
     receipt_object,
     verify_receipt,
+    verify_receipts,
 )
 
 
-def _sample_execution() -> Execution:
-    return Execution(
-        init=StateVector([0, 0]),
-        steps=[
-            Step(id="s1", delta=StateVector([1, 0]), action=1),
-            Step(id="s2", delta=StateVector([0, 1]), action=1),
-        ],
-        final=StateVector([1, 1]),
-        claims={"intent": "verify-test"},
-    )
-
-
-def test_verify_receipt_ok():
-    E = _sample_execution()
+def test_verify_receipt_ok(sample_execution):
+    E = sample_execution
     r = receipt_object(execution=E, target=StateVector([1, 1]))
     v = verify_receipt(receipt=r, execution=E)
     assert v.ok is True
     assert v.reason == "OK"
 
 
-def test_verify_receipt_detects_exec_id_mismatch():
-    E = _sample_execution()
+def test_verify_receipt_detects_exec_id_mismatch(sample_execution):
+    E = sample_execution
     r = receipt_object(execution=E)
     r["execution_id"] = "xk:sha256:" + "0" * 64  # tamper
     v = verify_receipt(receipt=r, execution=E)
     assert v.ok is False
     assert v.reason == "RECEIPT_EXECUTION_ID_MISMATCH"
+
+
+def test_verify_receipt_rejects_malformed_exec_id(sample_execution):
+    E = sample_execution
+    bad_ids = (
+        None,
+        42,
+        "xk:sha256:abc",
+        "xr:sha256:" + "0" * 64,
+        "xk:sha256:" + "g" * 64,  # right length, not hex
+        "xk:sha256:" + "A" * 64,  # hex, but not lowercase
+    )
+    for bad_id in bad_ids:
+        r = receipt_object(execution=E)
+        r["execution_id"] = bad_id
+        v = verify_receipt(receipt=r, execution=E)
+        assert v.ok is False
+        assert v.reason == "RECEIPT_EXECUTION_ID_MISMATCH"
+        assert v.details["got"] == bad_id
+
+
+def test_verify_receipts_matches_single_verification(sample_execution):
+    E = sample_execution
+    good = receipt_object(execution=E, target=StateVector([1, 1]))
+    bad = receipt_object(execution=E)
+    bad["execution_id"] = "xk:sha256:" + "0" * 64  # tamper
+
+    vs = verify_receipts(pairs=[(good, E), (bad, E), (good, E)])
+    assert [v.reason for v in vs] == ["OK", "RECEIPT_EXECUTION_ID_MISMATCH", "OK"]
+    assert vs == [verify_receipt(receipt=r, execution=E) for r in (good, bad, good)]
+
+
+def test_verify_receipt_ok_for_invalid_execution_with_target(sample_execution):
+    E = sample_execution
+    bad = Execution(init=E.init, steps=E.steps, final=StateVector([2, 2]), claims=E.claims)
+    r = receipt_object(execution=bad, target=StateVector([2, 2]))
+    assert r["verdict"]["reason"] == "REPLAY_MISMATCH"
+    assert r["closure"]["closed"] is False
+
+    v = verify_receipt(receipt=r, execution=bad)
+    assert v.ok is True
+
+
+def test_verify_receipts_sees_mutation_between_yields():
+    E = Execution(
+        init=StateVector([0, 0]),
+        steps=[Step(id="s1", delta=StateVector([1, 0]), action=1)],
+        final=StateVector([1, 0]),
+    )
+    r = receipt_object(execution=E)
+
+    def pairs():
+        yield r, E
+        E.steps[0].delta.coords[0] = 2  # tamper after the first pair
+        yield r, E
+
+    vs = verify_receipts(pairs=pairs())
+    assert [v.reason for v in vs] == ["RECEIPT_EXECUTION_ID_MISMATCH"] * 2
+    assert vs[0] == verify_receipt(receipt=r, execution=E)
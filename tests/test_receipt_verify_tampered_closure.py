@@ -1,26 +1,12 @@
 from xkernel import (
     StateVector,
-    Step,
-    Execution,
     receipt_object,
     verify_receipt,
 )
 
 
-def _sample_execution() -> Execution:
-    return Execution(
-        init=StateVector([0, 0]),
-        steps=[
-            Step(id="s1", delta=StateVector([1, 0]), action=1),
-            Step(id="s2", delta=StateVector([0, 1]), action=1),
-        ],
-        final=StateVector([1, 1]),
-        claims={"intent": "tamper-closure-test"},
-    )
-
-
-def test_verify_receipt_detects_tampered_closure_flag():
-    E = _sample_execution()
+def test_verify_receipt_detects_tampered_closure_flag(sample_execution):
+    E = sample_execution
 
     # Create a truthful receipt with a target that *does* close.
     r = receipt_object(execution=E, target=StateVector([1, 1]))
@@ -34,8 +20,8 @@ def test_verify_receipt_detects_tampered_closure_flag():
     assert v.reason == "RECEIPT_CLOSURE_MISMATCH"
 
 
-def test_verify_receipt_detects_tampered_closure_target():
-    E = _sample_execution()
+def test_verify_receipt_detects_tampered_closure_target(sample_execution):
+    E = sample_execution
 
     # Truthful receipt closes to [1,1]
     r = receipt_object(execution=E, target=StateVector([1, 1]))
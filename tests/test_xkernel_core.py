@@ -49,3 +49,72 @@ def test_non_admissible_step_rejected():
     v = validate_execution(E)
     assert v.ok is False
     assert v.reason == "NON_ADMISSIBLE_STEP"
+
+
+def test_replay_mismatch_reports_computed_coords():
+    E = Execution(
+        init=StateVector(coords=[0, 0], meta={}),
+        steps=[
+            Step(id="s1", delta=StateVector(coords=[1, 0], meta={}), action=1, witness={}),
+            Step(id="s2", delta=StateVector(coords=[1, 2], meta={}), action=1, witness={}),
+        ],
+        final=StateVector(coords=[1, 1], meta={}),
+        claims={},
+    )
+
+    v = validate_execution(E)
+    assert v.ok is False
+    assert v.reason == "REPLAY_MISMATCH"
+    assert v.details == {"computed": [2, 2], "declared": [1, 1]}
+
+
+def test_replay_dimension_mismatch_is_replay_error():
+    E = Execution(
+        init=StateVector(coords=[0, 0], meta={}),
+        steps=[Step(id="s1", delta=StateVector(coords=[1, 0, 0], meta={}), action=1, witness={})],
+        final=StateVector(coords=[1, 0], meta={}),
+        claims={},
+    )
+
+    v = validate_execution(E)
+    assert v.ok is False
+    assert v.reason == "REPLAY_ERROR"
+    assert v.details == {"error": "Dimension mismatch: 2 != 3"}
+
+
+def test_non_admissible_step_wins_over_earlier_replay_error():
+    E = Execution(
+        init=StateVector(coords=[0, 0], meta={}),
+        steps=[
+            Step(id="s1", delta=StateVector(coords=[1, 0, 0], meta={}), action=1, witness={}),
+            Step(id="s2", delta=StateVector(coords=[0, 1], meta={}), action=0, witness={}),
+        ],
+        final=StateVector(coords=[1, 1], meta={}),
+        claims={},
+    )
+
+    v = validate_execution(E)
+    assert v.ok is False
+    assert v.reason == "NON_ADMISSIBLE_STEP"
+    assert v.details["index"] == 1
+
+
+def test_kinds_are_slotted_and_frozen():
+    sv = StateVector(coords=[0, 0], meta={})
+    assert not hasattr(sv, "__dict__")
+    with pytest.raises(AttributeError):
+        sv.coords = [1, 1]
+
+
+def test_replay_ignores_non_mapping_init_meta():
+    # Replay never reads meta. 2.0.x replayed through apply_step, which
+    # copied meta, so a non-dict meta surfaced as REPLAY_ERROR.
+    E = Execution(
+        init=StateVector(coords=[0], meta=None),
+        steps=[Step(id="s1", delta=StateVector(coords=[1], meta={}), action=1, witness={})],
+        final=StateVector(coords=[1], meta={}),
+        claims={},
+    )
+
+    v = validate_execution(E)
+    assert v.ok is True